@@ -3,9 +3,8 @@ from datetime import date, datetime, time
 from decimal import Decimal
 from fractions import Fraction
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
-from itertools import chain
 from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
-from typing import Any, ByteString, Iterable, Mapping, MutableMapping, Optional, Type, TypeVar, overload
+from typing import Any, ByteString, Callable, Iterable, Mapping, MutableMapping, Optional, Type, TypeVar, overload
 from uuid import UUID
 
 from ...common import Dumper, Loader, TypeHint, VarTuple
@@ -16,6 +15,7 @@ from ...provider.provider_template import ValueProvider
 from ...provider.request_cls import DebugTrailRequest, LocStack, StrictCoercionRequest, TypeHintLoc
 from ...provider.shape_provider import BUILTIN_SHAPE_PROVIDER
 from ...retort.operating_retort import OperatingRetort
+from ...special_cases_optimization import as_is_stub
 from ...struct_trail import render_trail_as_note
 from ...type_tools.basic_utils import is_generic_class
 from ..concrete_provider import (
@@ -59,6 +59,33 @@ from ..request_cls import DumperRequest, LoaderRequest
 from .provider import as_is_dumper, as_is_loader, dumper, enum_by_exact_value, flag_by_exact_value, loader, name_mapping
 
 
+_STR_REPRESENTED_PROVIDERS = tuple(
+    provider
+    for tp in (
+        UUID,
+        IPv4Address, IPv6Address,
+        IPv4Network, IPv6Network,
+        IPv4Interface, IPv6Interface,
+    )
+    for provider in (
+        loader(tp, tp),
+        dumper(tp, tp.__str__),  # type: ignore[arg-type]
+    )
+)
+_PATH_PROVIDERS = tuple(
+    provider
+    for tp in (
+        PurePath, Path,
+        PurePosixPath, PosixPath,
+        PureWindowsPath, WindowsPath,
+    )
+    for provider in (
+        loader(tp, tp),
+        dumper(tp, tp.__fspath__),  # type: ignore[attr-defined]
+    )
+)
+
+
 class FilledRetort(OperatingRetort, ABC):
     """A retort contains builtin providers"""
 
@@ -104,29 +131,8 @@ class FilledRetort(OperatingRetort, ABC):
         IOBytesBase64Provider(),
         BytearrayBase64Provider(),
 
-        *chain.from_iterable(
-            (
-                loader(tp, tp),
-                dumper(tp, tp.__str__),  # type: ignore[arg-type]
-            )
-            for tp in [
-                UUID,
-                IPv4Address, IPv6Address,
-                IPv4Network, IPv6Network,
-                IPv4Interface, IPv6Interface,
-            ]
-        ),
-        *chain.from_iterable(
-            (
-                loader(tp, tp),
-                dumper(tp, tp.__fspath__),  # type: ignore[attr-defined]
-            )
-            for tp in [
-                PurePath, Path,
-                PurePosixPath, PosixPath,
-                PureWindowsPath, WindowsPath,
-            ]
-        ),
+        *_STR_REPRESENTED_PROVIDERS,
+        *_PATH_PROVIDERS,
         PathLikeProvider(),
 
         LiteralProvider(),
@@ -175,6 +181,23 @@ class FilledRetort(OperatingRetort, ABC):
 
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable[[Any], Any])
+
+
+def _wrap_with_trail_rendering(processor: F) -> F:
+    if processor == as_is_stub:  # it can not raise any error, so wrapper is redundant
+        return processor
+
+    def trail_rendering_wrapper(data):
+        try:
+            return processor(data)
+        except Exception as e:
+            render_trail_as_note(e)
+            raise
+
+    return trail_rendering_wrapper  # type: ignore[return-value]
+
+
 RequestT = TypeVar("RequestT", bound=Request)
 AR = TypeVar("AR", bound="AdornedRetort")
 
@@ -242,15 +265,7 @@ class AdornedRetort(OperatingRetort):
             error_message=f"Cannot produce loader for type {tp!r}",
         )
         if self._debug_trail == DebugTrail.FIRST:
-            def trail_rendering_wrapper(data):
-                try:
-                    return loader_(data)
-                except Exception as e:
-                    render_trail_as_note(e)
-                    raise
-
-            return trail_rendering_wrapper
-
+            return _wrap_with_trail_rendering(loader_)
         return loader_
 
     def get_dumper(self, tp: Type[T]) -> Dumper[T]:
@@ -268,15 +283,7 @@ class AdornedRetort(OperatingRetort):
             error_message=f"Cannot produce dumper for type {tp!r}",
         )
         if self._debug_trail == DebugTrail.FIRST:
-            def trail_rendering_wrapper(data):
-                try:
-                    return dumper_(data)
-                except Exception as e:
-                    render_trail_as_note(e)
-                    raise
-
-            return trail_rendering_wrapper
-
+            return _wrap_with_trail_rendering(dumper_)
         return dumper_
 
     @overload
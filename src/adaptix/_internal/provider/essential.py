@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable, Generic, Iterable, Optional, Sequence, TypeVar, final
+from typing import Any, Callable, Generic, Hashable, Iterable, Optional, Sequence, TypeVar, final
 
 from ..common import VarTuple
 from ..compat import CompatExceptionGroup
@@ -131,6 +131,16 @@ class Mediator(ABC, Generic[V]):
         that placed after current provider at the recipe.
         """
 
+    def cached_call(self, key: Hashable, func: Callable[..., T], *args: Any) -> T:
+        """Call ``func(*args)`` reusing the result for the same key while the mediator is alive.
+        Base implementation caches nothing.
+
+        :param key: A key identifying the result, it must be unique among all callers
+        :param func: A function producing the result
+        :return: Result of the function call
+        """
+        return func(*args)
+
     @final
     def delegating_provide(
         self,
@@ -215,6 +225,8 @@ def mandatory_apply_by_iterable(
 class Provider(ABC):
     """An object that can process Request instances"""
 
+    __slots__ = ()
+
     @abstractmethod
     def apply_provider(self, mediator: Mediator[T], request: Request[T]) -> T:
         """Handle request instance and return a value of type required by request.
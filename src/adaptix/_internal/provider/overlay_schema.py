@@ -1,6 +1,7 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from typing import Any, Callable, ClassVar, Generic, Iterable, Mapping, Optional, Type, TypeVar
 
+from ..common import VarTuple
 from ..datastructures import ClassMap
 from ..type_tools import strip_alias
 from ..utils import Omitted
@@ -20,11 +21,18 @@ Ov = TypeVar("Ov", bound="Overlay")
 
 Merger = Callable[[Any, Any, Any], Any]
 
+_OMITTED = Omitted()
+
 
 @dataclass(frozen=True)
 class Overlay(Generic[Sc]):
     _schema_cls: ClassVar[Type[Schema]]  # ClassVar cannot contain TypeVar
     _mergers: ClassVar[Optional[Mapping[str, Merger]]]
+    _field_names: ClassVar[VarTuple[str]]
+    _fully_omitted_mask: ClassVar[int]
+
+    # i-th bit is set if i-th field is omitted
+    _omitted_mask: int = field(init=False, repr=False, compare=False)
 
     def __init_subclass__(cls, *args, **kwargs):
         for base in cls.__orig_bases__:
@@ -34,47 +42,70 @@ class Overlay(Generic[Sc]):
         else:
             raise ValueError
 
+        # fields are not known until dataclass decorator is applied,
+        # so mergers are calculated at the creation of the first instance
         cls._mergers = None
 
-    def _default_merge(self, old: Any, new: Any) -> Any:
-        return new
-
-    def _is_omitted(self, value: Any) -> bool:
-        return value is Omitted()
-
-    @classmethod
-    def _load_mergers(cls) -> Mapping[str, Merger]:
+    def __post_init__(self):
+        cls = type(self)
         if cls._mergers is None:
-            cls._mergers = {
-                field.name: getattr(cls, f"_merge_{field.name}", cls._default_merge)
-                for field in fields(cls)
+            mergers = {
+                fld.name: getattr(cls, f"_merge_{fld.name}", cls._default_merge)
+                for fld in fields(cls)
+                if fld.init
             }
-        return cls._mergers
+            cls._field_names = tuple(mergers)
+            cls._fully_omitted_mask = (1 << len(mergers)) - 1
+            # _mergers is assigned last since it marks that the class is set up
+            cls._mergers = mergers
+
+        omitted_mask = 0
+        for i, field_id in enumerate(cls._field_names):
+            if getattr(self, field_id) is _OMITTED:
+                omitted_mask |= 1 << i
+        object.__setattr__(self, "_omitted_mask", omitted_mask)
+
+    def _default_merge(self, old: Any, new: Any) -> Any:
+        return new
 
     def merge(self: Ov, new: Ov) -> Ov:
-        merged = {}
-        for field_id, merger in self._load_mergers().items():
+        # overlays are immutable, so there is no need to copy them
+        if new._omitted_mask == self._fully_omitted_mask:
+            return self
+        if self._omitted_mask == self._fully_omitted_mask:
+            return new
+
+        values = []
+        for field_id, merger in self._mergers.items():  # type: ignore[union-attr]
             old_field_value = getattr(self, field_id)
             new_field_value = getattr(new, field_id)
-            if self._is_omitted(old_field_value):
-                merged[field_id] = new_field_value
-            elif self._is_omitted(new_field_value):
-                merged[field_id] = old_field_value
+            if old_field_value is _OMITTED:
+                values.append(new_field_value)
+            elif new_field_value is _OMITTED:
+                values.append(old_field_value)
             else:
-                merged[field_id] = merger(self, old_field_value, new_field_value)
-        return self.__class__(**merged)
+                values.append(merger(self, old_field_value, new_field_value))
+
+        # all values are already validated, so __init__ can be skipped
+        cls = type(self)
+        merged = cls.__new__(cls)
+        merged.__dict__.update(zip(cls._field_names, values))
+        merged.__dict__["_omitted_mask"] = self._omitted_mask & new._omitted_mask
+        return merged
 
     def to_schema(self) -> Sc:
-        omitted_fields = [
-            field_id for field_id, field_value in vars(self).items()
-            if self._is_omitted(field_value)
-        ]
-        if omitted_fields:
+        if self._omitted_mask:
+            omitted_fields = [
+                field_id for field_id in self._field_names
+                if getattr(self, field_id) is _OMITTED
+            ]
             raise ValueError(
                 f"Can not create schema because overlay contains omitted values at {omitted_fields}",
             )
+        field_values = self.__dict__.copy()
+        del field_values["_omitted_mask"]
         # noinspection PyArgumentList
-        return self._schema_cls(**vars(self))  # type: ignore[return-value]
+        return self._schema_cls(**field_values)  # type: ignore[return-value]
 
 
 @dataclass(frozen=True)
@@ -83,19 +114,26 @@ class OverlayRequest(LocatedRequest[Ov], Generic[Ov]):
 
 
 def provide_schema(overlay: Type[Overlay[Sc]], mediator: Mediator, loc_stack: LocStack) -> Sc:
-    stacked_overlay = mediator.mandatory_provide(
-        OverlayRequest(
-            loc_stack=loc_stack,
-            overlay_cls=overlay,
-        ),
+    request = OverlayRequest(
+        loc_stack=loc_stack,
+        overlay_cls=overlay,
     )
+    # mediator returns the same response to the same request, so schema can be reused
+    return mediator.cached_call((provide_schema, request), _calculate_schema, mediator, request)
+
+
+def _calculate_schema(mediator: Mediator, request: OverlayRequest[Overlay[Sc]]) -> Sc:
+    loc_stack = request.loc_stack
+    stacked_overlay = mediator.mandatory_provide(request)
     if isinstance(loc_stack.last.type, type):
-        for parent in loc_stack.last.type.mro()[1:]:
+        for parent in loc_stack.last.type.__mro__[1:]:
+            # absence of overlay for parent is expected,
+            # so error is not wrapped like in ``delegating_provide``
             try:
-                new_overlay = mediator.delegating_provide(
+                new_overlay = mediator.provide(
                     OverlayRequest(
                         loc_stack=loc_stack.replace_last_type(parent),
-                        overlay_cls=overlay,
+                        overlay_cls=request.overlay_cls,
                     ),
                 )
             except CannotProvide:
@@ -107,16 +145,17 @@ def provide_schema(overlay: Type[Overlay[Sc]], mediator: Mediator, loc_stack: Lo
 
 
 class OverlayProvider(StaticProvider):
+    __slots__ = ("_chain", "_overlays")
+
     def __init__(self, overlays: Iterable[Overlay], chain: Optional[Chain]):
         self._chain = chain
         self._overlays = ClassMap(*overlays)
 
     @static_provision_action
     def _provide_overlay(self, mediator: Mediator, request: OverlayRequest):
-        try:
-            overlay = self._overlays[request.overlay_cls]
-        except KeyError:
+        if request.overlay_cls not in self._overlays:
             raise CannotProvide
+        overlay = self._overlays[request.overlay_cls]
 
         if self._chain is None:
             return overlay
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
 
+from ..code_tools.code_builder import CodeBuilder
+from ..code_tools.compiler import BasicClosureCompiler, ClosureCompiler
+from ..common import VarTuple
 from .essential import AggregateCannotProvide, CannotProvide, Mediator, Provider, Request
 from .loc_stack_filtering import LocStackChecker
 from .request_cls import LocatedRequest
@@ -10,30 +14,61 @@ T = TypeVar("T")
 
 
 class RequestClassDeterminedProvider(Provider, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
         ...
 
 
+class CachingRequestClassDeterminedProvider(RequestClassDeterminedProvider, ABC):
+    __slots__ = ("_request_cls_cache", )
+
+    def __init__(self) -> None:
+        self._request_cls_cache: Dict[Type[Request], bool] = {}
+
+    def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+        try:
+            return self._request_cls_cache[request_cls]
+        except KeyError:
+            pass
+
+        result = self._compute_can_process_request_cls(request_cls)
+        self._request_cls_cache[request_cls] = result
+        return result
+
+    @abstractmethod
+    def _compute_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+        ...
+
+
 class ProviderWithLSC(Provider, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_loc_stack_checker(self) -> Optional[LocStackChecker]:
         ...
 
-    def _apply_loc_stack_checker(self, mediator: Mediator, request: Request) -> None:
+    def _check_loc_stack(self, mediator: Mediator, request: Request) -> bool:
         if not isinstance(request, LocatedRequest):
-            raise CannotProvide
+            return False
 
         loc_stack_checker = self.get_loc_stack_checker()
         if loc_stack_checker is None:
-            return
+            return True
+
+        return loc_stack_checker.check_loc_stack(mediator, request.loc_stack)
 
-        if not loc_stack_checker.check_loc_stack(mediator, request.loc_stack):
+    def _apply_loc_stack_checker(self, mediator: Mediator, request: Request) -> None:
+        if not self._check_loc_stack(mediator, request):
             raise CannotProvide
 
 
-class BoundingProvider(RequestClassDeterminedProvider, ProviderWithLSC):
+class BoundingProvider(CachingRequestClassDeterminedProvider, ProviderWithLSC):
+    __slots__ = ("_loc_stack_checker", "_provider")
+
     def __init__(self, loc_stack_checker: LocStackChecker, provider: Provider):
+        super().__init__()
         self._loc_stack_checker = loc_stack_checker
         self._provider = provider
 
@@ -44,25 +79,44 @@ class BoundingProvider(RequestClassDeterminedProvider, ProviderWithLSC):
     def __repr__(self):
         return f"{type(self).__name__}({self._loc_stack_checker}, {self._provider})"
 
-    def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
-        if isinstance(self._provider, RequestClassDeterminedProvider):
-            return self._provider.maybe_can_process_request_cls(request_cls)
-        return True
+    def _compute_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+        return (
+            not isinstance(self._provider, RequestClassDeterminedProvider)
+            or self._provider.maybe_can_process_request_cls(request_cls)
+        )
 
     def get_loc_stack_checker(self) -> Optional[LocStackChecker]:
         return self._loc_stack_checker
 
 
-class ConcatProvider(RequestClassDeterminedProvider):
+class ConcatProvider(CachingRequestClassDeterminedProvider):
+    __slots__ = ("_providers", )
+
     def __init__(self, *providers: Provider):
+        super().__init__()
         self._providers = providers
 
     def apply_provider(self, mediator: Mediator[T], request: Request[T]) -> T:
+        request_cls = type(request)
         exceptions = []
 
         for provider in self._providers:
+            # providers that obviously can not process the request are skipped without raising an exception
+            if (
+                isinstance(provider, RequestClassDeterminedProvider)
+                and not provider.maybe_can_process_request_cls(request_cls)
+            ):
+                continue
+            # subclasses may override apply_provider, so only exact BoundingProvider is unwrapped
+            if type(provider) is BoundingProvider:
+                if not provider._check_loc_stack(mediator, request):
+                    continue
+                target = provider._provider
+            else:
+                target = provider
+
             try:
-                return provider.apply_provider(mediator, request)
+                return target.apply_provider(mediator, request)
             except CannotProvide as e:
                 exceptions.append(e)
 
@@ -71,7 +125,7 @@ class ConcatProvider(RequestClassDeterminedProvider):
     def __repr__(self):
         return f"{type(self).__name__}({self._providers})"
 
-    def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+    def _compute_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
         return any(
             not isinstance(provider, RequestClassDeterminedProvider)
             or provider.maybe_can_process_request_cls(request_cls)
@@ -84,8 +138,16 @@ class Chain(Enum):
     LAST = "LAST"
 
 
-class ChainingProvider(RequestClassDeterminedProvider):
+# Steps of chains created by ChainingProvider.
+# They are not stored as function attribute because any user callable could provide it
+_CHAIN_STEPS: "WeakKeyDictionary[Callable, VarTuple[Callable]]" = WeakKeyDictionary()
+
+
+class ChainingProvider(CachingRequestClassDeterminedProvider):
+    __slots__ = ("_chain", "_provider")
+
     def __init__(self, chain: Chain, provider: Provider):
+        super().__init__()
         self._chain = chain
         self._provider = provider
 
@@ -94,18 +156,67 @@ class ChainingProvider(RequestClassDeterminedProvider):
         next_processor = mediator.provide_from_next()
 
         if self._chain == Chain.FIRST:
-            return self._make_chain(current_processor, next_processor)
+            return self._get_chain(mediator, current_processor, next_processor)
         if self._chain == Chain.LAST:
-            return self._make_chain(next_processor, current_processor)
+            return self._get_chain(mediator, next_processor, current_processor)
         raise ValueError
 
-    def _make_chain(self, first, second):
-        def chain_processor(data):
-            return second(first(data))
+    def _get_chain(self, mediator: Mediator, first, second):
+        # The same pair of processors is often chained several times while a single processor is being built.
+        # Processors may be unhashable, so they are identified by id,
+        # cached value keeps references to the processors, therefore ids can not be reused
+        return mediator.cached_call(
+            (type(self), id(first), id(second)),
+            self._make_chain_entry,
+            first,
+            second,
+        )[2]
+
+    def _make_chain_entry(self, first, second) -> Tuple[Any, Any, Callable]:
+        return first, second, self._make_chain(first, second)
+
+    def _get_chain_steps(self, processor) -> VarTuple[Callable]:
+        try:
+            return _CHAIN_STEPS[processor]
+        except (KeyError, TypeError):  # TypeError is raised for unhashable or not weak referenceable objects
+            return (processor, )
+
+    def _get_compiler(self) -> ClosureCompiler:
+        return BasicClosureCompiler()
 
+    def _make_chain(self, first, second):
+        # nested chains are flattened to call all steps from one function
+        steps = (*self._get_chain_steps(first), *self._get_chain_steps(second))
+        if len(steps) == 2:  # noqa: PLR2004
+            def chain_processor(data):
+                return second(first(data))
+        else:
+            chain_processor = self._compile_chain(steps)
+
+        _CHAIN_STEPS[chain_processor] = steps
         return chain_processor
 
-    def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
-        if isinstance(self._provider, RequestClassDeterminedProvider):
-            return self._provider.maybe_can_process_request_cls(request_cls)
-        return True
+    def _compile_chain(self, steps: VarTuple[Callable]) -> Callable:
+        namespace = {f"step_{i}": step for i, step in enumerate(steps)}
+
+        builder = CodeBuilder()
+        builder += "def chain_processor(data):"
+        with builder:
+            # one statement per step avoids parser nesting limit and shows failed step at traceback
+            for step_name in namespace:
+                builder += f"data = {step_name}(data)"
+            builder += "return data"
+        builder += "return chain_processor"
+
+        return self._get_compiler().compile(
+            "chain_processor",
+            lambda uid: f"<adaptix generated {uid}>",
+            builder,
+            namespace,
+        )
+
+    def _compute_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+        return (
+            not isinstance(self._provider, RequestClassDeterminedProvider)
+            or self._provider.maybe_can_process_request_cls(request_cls)
+        )
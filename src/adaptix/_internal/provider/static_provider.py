@@ -106,6 +106,8 @@ class StaticProvider(RequestClassDeterminedProvider):
     and collects all methods wrapped by :func:`static_provision_action` decorator.
     Then it merges list of new :func:`static_provision_action`'s with the parent ones.
     """
+    __slots__ = ()
+
     _sp_cls_request_dispatcher: ClassVar[RequestDispatcher] = RequestDispatcher()
 
     def __init_subclass__(cls, **kwargs):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Iterable, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Optional, TypeVar
 
 from ..provider.essential import AggregateCannotProvide, CannotProvide, Mediator, Request
 from ..utils import add_note
@@ -45,6 +45,7 @@ class BuiltinMediator(Mediator):
         self._current_request: Optional[Request] = None
         self.next_offset = 0
         self.recursion_stubs: Dict[Request, Any] = {}
+        self._call_cache: Dict[Hashable, Any] = {}
 
     def provide(self, request: Request[T]) -> T:
         stub = self.recursion_resolver.track_recursion(request)
@@ -65,6 +66,16 @@ class BuiltinMediator(Mediator):
             raise ValueError
         return self._provide_non_recursive(self._current_request, self.next_offset)
 
+    def cached_call(self, key: Hashable, func: Callable[..., T], *args: Any) -> T:
+        try:
+            return self._call_cache[key]
+        except KeyError:
+            pass
+
+        result = func(*args)
+        self._call_cache[key] = result
+        return result
+
     def _provide_non_recursive(self, request: Request[T], search_offset: int) -> T:
         init_next_offset = self.next_offset
         exceptions = []
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from itertools import islice
 from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple, Type, TypeVar
 
-from ..common import TypeHint
+from ..common import TypeHint, VarTuple
 from ..provider.essential import CannotProvide, Mediator, Provider, Request
 from ..provider.loc_stack_filtering import ExactOriginLSC
 from ..provider.provider_wrapper import ProviderWithLSC, RequestClassDeterminedProvider
@@ -125,21 +125,21 @@ class ExactOriginMergedProvider(Provider):
 class IntrospectingRecipeSearcher(RecipeSearcher):
     def __init__(self, recipe: Sequence[Provider]):
         self._recipe = recipe
-        self._cls_to_recipe: Dict[Type[Request], Sequence[Provider]] = {}
+        self._cls_to_provide_callables: Dict[Type[Request], VarTuple[ProvideCallable]] = {}
 
     def search_candidates(self, search_offset: int, request: Request) -> Iterable[SearchResult]:
         request_cls = type(request)
         try:
-            sub_recipe = self._cls_to_recipe[request_cls]
+            provide_callables = self._cls_to_provide_callables[request_cls]
         except KeyError:
-            sub_recipe = self._collect_candidates(request_cls, self._recipe)
-            self._cls_to_recipe[request_cls] = sub_recipe
+            provide_callables = tuple(
+                provider.apply_provider
+                for provider in self._collect_candidates(request_cls, self._recipe)
+            )
+            self._cls_to_provide_callables[request_cls] = provide_callables
 
-        for i, provider in enumerate(
-            islice(sub_recipe, search_offset, None),
-            start=search_offset,
-        ):
-            yield provider.apply_provider, i + 1
+        for i in range(search_offset, len(provide_callables)):
+            yield provide_callables[i], i + 1
 
     def _create_combiner(self) -> Combiner:
         return ExactOriginCombiner()
@@ -171,7 +171,7 @@ class IntrospectingRecipeSearcher(RecipeSearcher):
         return self._merge_providers(candidates)
 
     def clear_cache(self):
-        self._cls_to_recipe = {}
+        self._cls_to_provide_callables = {}
 
     def get_max_offset(self) -> int:
         return len(self._recipe)
@@ -1,7 +1,10 @@
+from typing import Any, List
+
 import pytest
 from tests_helpers import PlaceholderProvider, full_match
 
 from adaptix import DebugTrail, Retort
+from adaptix._internal.special_cases_optimization import as_is_stub
 
 
 def test_retort_replace():
@@ -45,3 +48,19 @@ def test_generic_class_inferring():
         ),
     ):
         Retort().dump([1, 2, 3])
+
+
+def test_as_is_processors_are_not_wrapped_at_first_debug_trail():
+    retort = Retort(debug_trail=DebugTrail.FIRST)
+
+    assert retort.get_loader(Any) is as_is_stub
+    assert retort.get_dumper(str) is as_is_stub
+    assert retort.get_loader(str) is not as_is_stub
+
+
+def test_generic_alias_cache():
+    retort = Retort()
+    loader = retort.get_loader(List[int])
+
+    assert retort.get_loader(List[int]) is loader
+    assert retort.get_dumper(List[int]) is retort.get_dumper(List[int])
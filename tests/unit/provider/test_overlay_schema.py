@@ -329,3 +329,47 @@ def test_omitted_fields():
             ],
             provide_action=provide_myclass1,
         )
+
+
+def test_merge():
+    old = MyOverlay(number=1, char_list=("a", "b"))
+    new = MyOverlay(number=Omitted(), char_list=("c", "d"))
+    merged = old.merge(new)
+
+    assert type(merged) is MyOverlay
+    assert merged == MyOverlay(number=1, char_list=("c", "d", "a", "b"))
+    assert hash(merged) == hash(MyOverlay(number=1, char_list=("c", "d", "a", "b")))
+
+
+def test_merge_fully_omitted():
+    overlay = MyOverlay(number=1, char_list=("a", "b"))
+    omitted_overlay = MyOverlay(number=Omitted(), char_list=Omitted())
+
+    assert overlay.merge(omitted_overlay) is overlay
+    assert omitted_overlay.merge(overlay) is overlay
+    assert omitted_overlay.merge(omitted_overlay).merge(overlay) is overlay
+
+
+def test_schema_is_reused_within_mediator():
+    def provide_action(mediator):
+        schema = provide_myclass1(mediator)
+        assert provide_myclass1(mediator) is schema
+        return schema
+
+    assert provide_overlay_schema(
+        recipe=[
+            OverlayProvider(
+                overlays=[
+                    MyOverlay(
+                        number=1,
+                        char_list=("a", "b"),
+                    ),
+                ],
+                chain=None,
+            ),
+        ],
+        provide_action=provide_action,
+    ) == MySchema(
+        number=1,
+        char_list=("a", "b"),
+    )
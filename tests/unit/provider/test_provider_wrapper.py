@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from typing import Type
+from unittest.mock import MagicMock
+
+from adaptix import Chain, Mediator, P, Request, Retort, bound, loader
+from adaptix._internal.morphing.request_cls import DumperRequest, LoaderRequest
+from adaptix._internal.provider.loc_stack_filtering import create_loc_stack_checker
+from adaptix._internal.provider.provider_wrapper import (
+    _CHAIN_STEPS,
+    BoundingProvider,
+    ChainingProvider,
+    ConcatProvider,
+    RequestClassDeterminedProvider,
+)
+from adaptix._internal.provider.request_cls import LocStack, TypeHintLoc
+from adaptix._internal.provider.static_provider import StaticProvider, static_provision_action
+
+
+class ForbiddenProvider(RequestClassDeterminedProvider):
+    def __init__(self, request_cls: Type[Request]):
+        self._request_cls = request_cls
+
+    def apply_provider(self, mediator: Mediator, request: Request):
+        raise AssertionError("Provider must not be called")
+
+    def maybe_can_process_request_cls(self, request_cls: Type[Request]) -> bool:
+        return issubclass(request_cls, self._request_cls)
+
+
+def test_concat_provider_skips_unsuitable_providers():
+    retort = Retort(
+        recipe=[
+            ConcatProvider(
+                ForbiddenProvider(DumperRequest),
+                bound(str, ForbiddenProvider(LoaderRequest)),
+                loader(int, lambda x: "int loader"),
+            ),
+        ],
+    )
+
+    assert retort.load(1, int) == "int loader"
+
+
+def test_concat_provider_respects_bounding_provider_subclass():
+    class ConstBoundingProvider(BoundingProvider):
+        def apply_provider(self, mediator: Mediator, request: Request):
+            return lambda x: "overridden"
+
+    retort = Retort(
+        recipe=[
+            ConcatProvider(
+                ConstBoundingProvider(create_loc_stack_checker(int), loader(P.ANY, lambda x: "int loader")),
+            ),
+        ],
+    )
+
+    assert retort.load(1, int) == "overridden"
+
+
+def test_chaining_provider_flattens_nested_chains():
+    retort = Retort(
+        recipe=[
+            loader(int, lambda x: x + "c", Chain.LAST),
+            loader(int, lambda x: x + "b", Chain.LAST),
+            loader(int, lambda x: x + "a"),
+        ],
+    )
+
+    int_loader = retort.get_loader(int)
+    assert int_loader("") == "abc"
+    assert len(_CHAIN_STEPS[int_loader]) == 3
+
+
+def test_chaining_provider_handles_long_chains():
+    retort = Retort(
+        recipe=[
+            *[loader(int, lambda x: x + 1, Chain.LAST) for _ in range(210)],
+            loader(int, int),
+        ],
+    )
+
+    assert retort.load(0, int) == 210
+
+
+def test_chaining_provider_does_not_flatten_foreign_callables():
+    retort = Retort(
+        recipe=[
+            loader(int, lambda x: x + 1, Chain.LAST),
+            loader(int, MagicMock(return_value=42)),
+        ],
+    )
+
+    assert retort.load(1, int) == 43
+    # chain of two steps is not compiled
+    assert not retort.get_loader(int).__code__.co_filename.startswith("<adaptix generated")
+
+
+@dataclass(frozen=True)
+class SampleRequest(Request):
+    pass
+
+
+class SampleRequestProvider(StaticProvider):
+    @static_provision_action
+    def _provide_sample(self, mediator: Mediator, request: SampleRequest):
+        return [
+            mediator.provide(LoaderRequest(loc_stack=LocStack(TypeHintLoc(type=int))))
+            for _ in range(2)
+        ]
+
+
+def test_chaining_provider_reuses_chain():
+    retort = Retort(
+        recipe=[
+            loader(int, lambda x: x * 2, Chain.LAST),
+            SampleRequestProvider(),
+        ],
+    )
+
+    first_loader, second_loader = retort._facade_provide(SampleRequest(), error_message="")
+    assert first_loader(1) == 2
+    assert first_loader is second_loader
+
+
+def test_chaining_provider_subclass_does_not_reuse_foreign_chain():
+    class TaggingChainingProvider(ChainingProvider):
+        def _make_chain(self, first, second):
+            return lambda data: ("tagged", second(first(data)))
+
+    @dataclass
+    class Model:
+        a: int
+        b: int
+
+    def double(data):
+        return data * 2
+
+    retort = Retort(
+        recipe=[
+            bound(P[Model].b, TaggingChainingProvider(Chain.LAST, loader(P.ANY, double))),
+            loader(P[Model].a, double, Chain.LAST),
+        ],
+    )
+
+    assert retort.load({"a": 1, "b": 1}, Model) == Model(a=2, b=("tagged", 2))